@@ -1,4 +1,6 @@
 from enum import IntEnum
+import pathlib
+import tkinter as tk
 import PySimpleGUI as sg
 
 
@@ -10,18 +12,33 @@ class DispFmt(IntEnum):
     NUM_FMTS = 3
 
 
+class ClockNum(IntEnum):
+    """ Clock digit positions, left to right """
+    HR10 = 0
+    HR01 = 1
+    MIN10 = 2
+    MIN01 = 3
+
+
 IMG_PATH = './pngs'
 MAX_STEP = 4                # number of steps (images) for a flip
 
+# displayed hour for each hour of the day (0..23)
+_H24 = tuple(range(24))
+_H12 = tuple(12 if hr == 0 else (hr - 12 if hr > 12 else hr) for hr in range(24))
+
 
 class ClockDigit:
     """ Encapsulates a single digit of the flip clock """
     def __init__(self, key: str, digits='0123456789'):
         self.key = key          # psg Image key
-        self.digits = digits    # list of digits to use (wrap around)
         self.curr_idx = 0       # index into digits for current digit
         self.next_idx = 0       # index for next digit when flipping
         self.step = 0           # flipping step
+        self.images = {}        # image path -> pre-loaded tk.PhotoImage
+        self._widget = None     # Tk widget of the psg Image, once bound to a window
+        self._shown = None      # image currently displayed by the widget
+        self.set_digit_list(digits)
 
     def set_digit_list(self, digits: str):
         """ Set the list of available digit characters to be displayed.
@@ -29,7 +46,11 @@ class ClockDigit:
             usually restricted to fewer characters (0-1, 0-2, 0-5).
             'x' is used to stand in for a blank to avoid filesystem issues.
         """
-        self.digits = digits
+        self.digits = digits    # list of digits to use (wrap around)
+        # image paths for every [curr_idx][next_idx][step]
+        self._fnames = [[[f'{IMG_PATH}/{curr_dig}{to_dig}{step}.png' for step in range(MAX_STEP)]
+                         for to_dig in digits]
+                        for curr_dig in digits]
         if self.curr_idx >= len(self.digits) or self.next_idx >= len(self.digits):
             # reset if currently out-of-range
             self.curr_idx = self.next_idx = self.step = 0
@@ -41,22 +62,33 @@ class ClockDigit:
             self.curr_idx = self.next_idx
         self.step = 0
 
-    def draw(self, window: sg.Window):
-        """ Load the digit's image file and display on screen """
-        curr_dig = self.digits[self.curr_idx]
-        to_dig = self.digits[self.next_idx]
-        fname = f'{IMG_PATH}/{curr_dig}{to_dig}{self.step}.png'
-        window[self.key].update(filename=fname)
-
-    def do_step(self, window: sg.Window) -> bool:
-        """ Animate a step of the flip from the current to the next digit """
+    def get_image_path(self) -> str:
+        """ Path of the image file for the digit's current state """
+        return self._fnames[self.curr_idx][self.next_idx][self.step]
+
+    def bind(self, window: sg.Window, images: dict[str, tk.PhotoImage]):
+        """ Attach to the (finalized) window's Image element and pre-loaded images """
+        self._widget = window[self.key].Widget
+        self.images = images
+
+    def draw(self):
+        """ Display the digit's (pre-loaded) image on screen """
+        image = self.images[self.get_image_path()]
+        if image is not self._shown:    # skip re-drawing an unchanged digit
+            # bypass psg's update(filename=) which re-reads the file every time
+            self._widget.configure(image=image)
+            self._shown = image
+
+    def do_step(self) -> bool:
+        """ Advance a step of the flip from the current to the next digit.
+            Returns True if the digit changed and needs to be re-drawn.
+        """
         if self.curr_idx != self.next_idx:
             self.step += 1
             if self.step >= MAX_STEP:
-                # flip done: draw final digit image
+                # flip done: final digit image is next to be drawn
                 self.curr_idx = self.next_idx
                 self.step = 0
-            self.draw(window)
             return True
         else:       # no step needed
             return False
@@ -72,19 +104,42 @@ class ClockFace:
         self.hr01 = ClockDigit(key='-HR1s-', digits='0123456789')
         self.min10 = ClockDigit(key='-MIN10s-', digits='012345')
         self.min01 = ClockDigit(key='-MIN1s-', digits='0123456789')
+        self._digits = {ClockNum.HR10: self.hr10, ClockNum.HR01: self.hr01,
+                        ClockNum.MIN10: self.min10, ClockNum.MIN01: self.min01}
         self.stepping = False
-        self.disp_fmt = fmt
-        self.set_disp_fmt(self.disp_fmt)
+        self._pending = 0       # bit mask (1 << ClockNum) of digits still flipping
+        self.disp_fmt = None
+        self.set_disp_fmt(fmt)
 
     def set_disp_fmt(self, fmt: DispFmt):
         """ Set display format to 24-hour, 12-hour, or 12-hour with leading blank """
+        if fmt == self.disp_fmt:
+            return
+
         if fmt == DispFmt.HR24:
-            self.hr10.digits = '012'
+            self.hr10.set_digit_list('012')
         elif fmt == DispFmt.HR12:
-            self.hr10.digits = '01'
+            self.hr10.set_digit_list('01')
         else:
-            self.hr10.digits = 'x1'
+            self.hr10.set_digit_list('x1')
         self.disp_fmt = fmt
+        self._hr_table = _H24 if fmt == DispFmt.HR24 else _H12
+
+    def load_images(self, window: sg.Window):
+        """ Read and decode all digit images once, after the window has been finalized.
+            Digit images are named as 3 characters: <current><next><step>.png
+        """
+        images = {}
+        for path in pathlib.Path(IMG_PATH).glob('???.png'):
+            images[f'{IMG_PATH}/{path.name}'] = tk.PhotoImage(master=window.TKroot, file=path)
+
+        for digit in self._digits.values():
+            digit.bind(window, images)  # shared: all digits use the same image files
+
+    def make_image(self, num: ClockNum) -> sg.Image:
+        """ Create the psg Image element for a digit position """
+        digit = self._digits[num]
+        return sg.Image(filename=digit.get_image_path(), key=digit.key, pad=(1, 2))
 
     def get_disp_fmt(self) -> DispFmt:
         return self.disp_fmt
@@ -94,27 +149,33 @@ class ClockFace:
 
     def set_time(self, hours: int, mins: int, start_step=False):
         """ Set the current hours:mins and if should initiate a "flip" """
-        if self.disp_fmt != DispFmt.HR24:
-            if hours > 12:
-                hours -= 12
-            elif hours == 0:
-                hours = 12
-
-        self.stepping = start_step
-        self.hr10.set_digit(hours // 10, self.stepping)
-        self.hr01.set_digit(hours % 10, self.stepping)
-        self.min10.set_digit(mins // 10, self.stepping)
-        self.min01.set_digit(mins % 10, self.stepping)
+        hours = self._hr_table[hours]
+        values = (hours // 10, hours % 10, mins // 10, mins % 10)   # in ClockNum order
+        self._pending = 0
+        for num, value in zip(ClockNum, values):
+            digit = self._digits[num]
+            digit.set_digit(value, start_step)
+            if digit.curr_idx != digit.next_idx:
+                self._pending |= 1 << num
+        self.stepping = self._pending != 0
 
     def draw_all(self, window: sg.Window):
-        """ Draw all digits directly (at init or after gross time change) """
-        self.hr10.draw(window)
-        self.hr01.draw(window)
-        self.min10.draw(window)
-        self.min01.draw(window)
+        """ Draw all digits directly (at init or after gross time change).
+            Only digits whose image has changed are actually re-drawn.
+        """
+        for digit in self._digits.values():
+            digit.draw()
+        window.TKroot.update_idletasks()    # single redraw for all digits
 
     def do_step(self, window: sg.Window):
         """ Update to the next intra-digit frame """
-        if self.stepping:   # check from low to high
-            self.stepping = (self.min01.do_step(window) or self.min10.do_step(window) or
-                             self.hr01.do_step(window) or self.hr10.do_step(window))
+        if self.stepping:   # check from low to high: only one digit flips at a time
+            for num in reversed(ClockNum):
+                if self._pending & (1 << num):
+                    digit = self._digits[num]
+                    if digit.do_step():
+                        digit.draw()
+                        window.TKroot.update_idletasks()
+                        break
+                    self._pending &= ~(1 << num)    # flip done
+            self.stepping = self._pending != 0
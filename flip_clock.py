@@ -13,12 +13,12 @@ clock to a time just before a full 4-digit change and then runs as if a minute
 was only 6 seconds long.
 """
 import time
+import tkinter as tk
 import PySimpleGUI as sg
-from clock_digit import ClockFace, DispFmt, IMG_PATH
+from clock_digit import ClockFace, ClockNum, DispFmt, IMG_PATH
 
 # PSG info
 COLON_KEY = '-COLON-'
-TICK_KEY = '-TICK-'
 TOP_BTN = '-TOP-BTN-'
 BOT_BTN = '-BOT-BTN-'
 BABBLE_KEY = '-BABBLE-'
@@ -43,17 +43,16 @@ def make_layout() -> list[list]:
     btn_col = sg.Column([top_btn, bot_btn])
 
     # logo, digits in "major" to "minor" order with colon, and buttons column
-    digit0_path = f'{IMG_PATH}/000.png'     # init all to '0'
     digits_row = [
         sg.Image(filename=f'{IMG_PATH}/logo.png', pad=((1, 8), (2, 2))),
 
-        sg.Image(digit0_path, key=theClock.hr10.key, pad=(1, 2)),
-        sg.Image(digit0_path, key=theClock.hr01.key, pad=(1, 2)),
+        theClock.make_image(ClockNum.HR10),
+        theClock.make_image(ClockNum.HR01),
 
         sg.Image(filename=f'{IMG_PATH}/colon1.png', key=COLON_KEY, pad=(1, 2)),
 
-        sg.Image(digit0_path, key=theClock.min10.key, pad=(1, 2)),
-        sg.Image(digit0_path, key=theClock.min01.key, pad=(1, 2)),
+        theClock.make_image(ClockNum.MIN10),
+        theClock.make_image(ClockNum.MIN01),
 
         btn_col
     ]
@@ -65,8 +64,8 @@ def make_layout() -> list[list]:
 
 
 def millis() -> int:
-    """ Emulate Arduino millis() function """
-    return time.time_ns() // (1000 * 1000)      # nanoseconds -> microseconds
+    """ Emulate Arduino millis() function (monotonic: unaffected by system clock changes) """
+    return time.monotonic_ns() // (1000 * 1000)     # nanoseconds -> milliseconds
 
 
 def babble(txt: str, window: sg.Window) -> bool:
@@ -121,62 +120,80 @@ def main():
     layout = make_layout()
     window = sg.Window(f'T-Display-S3', layout=layout, font=THE_FONT,
                        background_color=BG_COLOR, finalize=True)
+    theClock.load_images(window)
+    root = window.TKroot
     run_fast = False
     hours, mins, tick_ms = get_time(run_fast, theClock.get_disp_fmt())
     theClock.set_time(hours, mins, start_step=False)
     theClock.draw_all(window)
     babble_on = babble('Starting...', window)
+    babble_start = millis()
     colon_on = True
-    step_start = 0
-    tick_start = colon_start = babble_start = millis()
+    colon_widget = window[COLON_KEY].Widget
+    colon_images = [tk.PhotoImage(master=root, file=f'{IMG_PATH}/colon{n}.png') for n in range(2)]
+    step_id = None
+
+    # Each callback re-arms itself in a "finally" so that an error is reported
+    # (by Tk) without silently stopping its timer.
+    def step_cb():
+        """ Flipping progress: re-arm until all digits are done """
+        nonlocal step_id
+        try:
+            theClock.do_step(window)
+        finally:
+            step_id = root.after(STEP_MS, step_cb) if theClock.is_stepping() else None
+
+    def tick_cb():
+        """ Time to update clock display """
+        nonlocal hours, mins, tick_ms, tick_id, step_id, babble_on, babble_start
+        try:
+            hours, mins, tick_ms = update_time(hours, mins, run_fast)
+            if tick_ms >= 0:
+                # simple increment
+                theClock.set_time(hours, mins, start_step=True)
+                theClock.do_step(window)
+                if theClock.is_stepping() and step_id is None:
+                    step_id = root.after(STEP_MS, step_cb)
+            else:
+                # major change: reset display
+                tick_ms = -tick_ms
+                theClock.set_time(hours, mins, start_step=False)
+                theClock.draw_all(window)
+                babble_on = babble('Time re-sync', window)
+                babble_start = millis()
+        finally:
+            tick_id = root.after(tick_ms, tick_cb)
+
+    def colon_cb():
+        """ Toggle the colon ON and OFF, and expire any text at bottom of screen """
+        nonlocal colon_on, babble_on
+        try:
+            colon_on = not colon_on
+            colon_widget.configure(image=colon_images[colon_on])     # colon0 | colon1
+
+            if babble_on and (millis() - babble_start >= BABBLE_MS):
+                # clear the text at bottom of screen
+                babble_on = babble('', window)
+        finally:
+            root.after(COLON_MS, colon_cb)
+
+    # Tk runs these timers while window.read() waits for button events
+    root.after(COLON_MS, colon_cb)
+    tick_id = root.after(tick_ms, tick_cb)
 
     while True:
-        # Emulate ESP32 Arduino framework "loop()" with a short timeout event
-        event, values = window.read(timeout=100, timeout_key=TICK_KEY)
+        event, values = window.read()
         if event in [sg.WIN_CLOSED]:
             break
 
-        now = millis()
-        if event == TICK_KEY:
-            if theClock.is_stepping() and (now - step_start >= STEP_MS):
-                # flipping progress
-                theClock.do_step(window)
-                step_start = now
-            elif now - tick_start >= tick_ms:
-                # time to update clock display
-                hours, mins, tick_ms = update_time(hours, mins, run_fast)
-                if tick_ms >= 0:
-                    # simple increment
-                    theClock.set_time(hours, mins, start_step=True)
-                    theClock.do_step(window)
-                else:
-                    # major change: reset display
-                    theClock.set_time(hours, mins, start_step=False)
-                    theClock.draw_all(window)
-                    babble_on = babble('Time re-sync', window)
-                    tick_ms = -tick_ms
-
-                tick_start = now
-
-            if now - colon_start >= COLON_MS:
-                # toggle the colonON and OFF
-                colon_on = not colon_on
-                fn = 'colon1' if colon_on else 'colon0'
-                window[COLON_KEY].update(filename=f'{IMG_PATH}/{fn}.png')
-                colon_start = now
-
-            if babble_on and (now - babble_start >= BABBLE_MS):
-                # clear the text at bottom of screen
-                babble_on = babble('', window)
-
-        elif event == TOP_BTN:
+        if event == TOP_BTN:
             # Toggle display format
             fmt = (theClock.get_disp_fmt() + 1) % DispFmt.NUM_FMTS
             theClock.set_disp_fmt(fmt)
             theClock.set_time(hours, mins, start_step=False)
             theClock.draw_all(window)
             babble_on = babble(DISP_FMT_LABELS[fmt], window)
-            babble_start = now
+            babble_start = millis()
 
         elif event == BOT_BTN:
             # Toggle "demo" mode where 1 minute elapses in 6 seconds
@@ -185,7 +202,9 @@ def main():
             theClock.set_time(hours, mins, start_step=False)
             theClock.draw_all(window)
             babble_on = babble(f'Demo mode is {"ON" if run_fast else "OFF"}', window)
-            babble_start = tick_start = now
+            babble_start = millis()
+            root.after_cancel(tick_id)      # restart tick timer at new rate
+            tick_id = root.after(tick_ms, tick_cb)
 
 
 if __name__ == '__main__':
@@ -5,8 +5,9 @@ This includes whole digit images as well as combined "previous" digit" and
 Output is in .png | .jpg | .bmp format for use in desktop programs
 or in a custom RGB565 format for use with a particular TFT display.
 """
-import PIL
-from PIL import Image, ImageDraw, ImageFont
+import multiprocessing
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+import numpy as np
 import pathlib
 import struct
 
@@ -31,6 +32,8 @@ BLANK_FLAG = 'x'                            # safe replacement for ' ' in filena
 font_size = 0
 digit_w = 0
 digit_h = 0
+font = None         # digits font, loaded once at font_size
+digit_imgs = {}     # digit -> "whole" digit image, rendered once
 
 
 def compute_sizes() -> tuple[int, int, int]:
@@ -40,18 +43,24 @@ def compute_sizes() -> tuple[int, int, int]:
     digit_text = "0"
     max_w = SCREEN_W - (2 * PAD_LR)
     max_h = SCREEN_H - (2 * PAD_TB)
-    fsize = max_h      # initial guess too big!
-
-    # Compute largest font size that fits on screen (with padding)
-    while True:
-        font = ImageFont.truetype(FONT_FACE, fsize)
-        left, top, right, bottom = font.getbbox(max_text)
-        if (right - left < max_w) and (bottom - top < max_h):
-            break
+
+    def fits(fsize: int) -> bool:
+        left, top, right, bottom = ImageFont.truetype(FONT_FACE, fsize).getbbox(max_text)
+        return (right - left < max_w) and (bottom - top < max_h)
+
+    # Binary search for largest font size that fits on screen (with padding),
+    # trying sizes in steps of 2 down from max_h
+    lo, hi = 0, (max_h - 8) // 2        # number of steps down (8pt minimum)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if fits(max_h - 2 * mid):
+            hi = mid
         else:
-            fsize -= 2
+            lo = mid + 1
+    fsize = max_h - 2 * lo
 
     # Compute single digit box size
+    font = ImageFont.truetype(FONT_FACE, fsize)
     left, top, right, bottom = font.getbbox(digit_text)
 
     # Round digit sizes up if odd
@@ -68,30 +77,29 @@ def convertRGB565(image: Image, outfile_path: pathlib.Path):
         Note: all values are in "big-endian" format to optimize display processing (even though
         most micro-controllers are natively "little-endian").
     """
-    try:
-        with open(outfile_path, 'wb') as output:
-            hdr = struct.pack('>4s3I', b'R565', image.width, image.height, 0)   # big-endian w&h + 1 reserved int32s
-            output.write(hdr)
-            for pixel in image.getdata():
-                int16 = ((pixel[0] & 0xF8) << 8) | ((pixel[1] & 0xFC) << 3) | ((pixel[2] & 0xF8) >> 3)
-                output.write(struct.pack('>H', int16))
-
-    except (FileNotFoundError, PIL.UnidentifiedImageError) as err:
-        print(err)
-        exit(1)
+    with open(outfile_path, 'wb') as output:
+        hdr = struct.pack('>4s3I', b'R565', image.width, image.height, 0)   # big-endian w&h + 1 reserved int32s
+        output.write(hdr)
+        # convert all pixels at once: (height, width, RGB) -> (height, width) 16-bit values
+        pixels = np.asarray(image, dtype=np.uint16)
+        red, green, blue = pixels[..., 0], pixels[..., 1], pixels[..., 2]
+        rgb565 = ((red & 0xF8) << 8) | ((green & 0xFC) << 3) | ((blue & 0xF8) >> 3)
+        output.write(rgb565.astype('>u2').tobytes())
 
 
 def saveImage(image: Image, filename: str):
     """Save image in desired format"""
     if OUT_FORM == 'rgb565':
         convertRGB565(image, pathlib.Path(f'{OUT_PATH}/{filename}.rgb565'))
+    elif OUT_FORM == 'png':
+        # fast compression: files are decoded only once by flip_clock.py
+        image.save(pathlib.Path(f'{OUT_PATH}/{filename}.png'), compress_level=1, optimize=False)
     else:
         image.save(pathlib.Path(f'{OUT_PATH}/{filename}.{OUT_FORM}'))
 
 
 def make_colons():
     """ Create (narrower) colon image to align with digits without digit background or divider """
-    font = ImageFont.truetype(FONT_FACE, font_size)
     w = int(font.getlength(':'))    # use "real" colon width
     img = Image.new(mode="RGB", size=(w, digit_h), color=SCREEN_BG)
     saveImage(img, 'colon0')        # colon off = blank
@@ -99,15 +107,11 @@ def make_colons():
     # draw two circles evenly positioned above/below center line
     drw = ImageDraw.Draw(img)
     dot_r = w // 4
-    lr_center = w // 2
+    x0, x1 = w // 2 - dot_r, w // 2 + dot_r
     tb_upper = digit_h // 4             # 1/4 from top
-    x0, y0 = lr_center - dot_r, tb_upper - dot_r
-    x1, y1 = lr_center + dot_r, tb_upper + dot_r
-    drw.ellipse(((x0, y0), (x1, y1)), fill=DIGIT_FG)
     tb_lower = digit_h - tb_upper       # 1/4 from bottom
-    x0, y0 = lr_center - dot_r, tb_lower - dot_r
-    x1, y1 = lr_center + dot_r, tb_lower + dot_r
-    drw.ellipse(((x0, y0), (x1, y1)), fill=DIGIT_FG)
+    for tb_center in (tb_upper, tb_lower):
+        drw.ellipse(((x0, tb_center - dot_r), (x1, tb_center + dot_r)), fill=DIGIT_FG)
     saveImage(img, 'colon1')        # colon on
 
 
@@ -126,75 +130,88 @@ def make_digit_image(digit: str, font: ImageFont) -> Image:
     return img
 
 
+def make_whole_image(digit: str):
+    """ Create and save the "whole" (not flipping) image of a digit """
+    saveImage(digit_imgs[digit], f'{digit}{digit}0')
+
+
 def make_images(text='01'):
-    """ Create and save "whole" digit image as well as additional "steps" as the images
-        "roll" from the initial digit to the final one.
+    """ Create and save the additional "steps" as the images "roll" from the
+        initial digit to the final one. The "whole" digit images are saved by make_whole_image().
     """
-    font = ImageFont.truetype(FONT_FACE, font_size)
     init_dig = text[0]
     final_dig = text[1]
 
-    # make image for initial/final digits
-    init_img = make_digit_image(init_dig, font)
-    final_img = make_digit_image(final_dig, font)
+    # pre-rendered images for initial/final digits (shared: do not modify)
+    init_img = digit_imgs[init_dig]
+    final_img = digit_imgs[final_dig]
+
+    # Compose the steps as pixel arrays (rows, columns, RGB) to avoid intermediate images
+    init_px = np.asarray(init_img)
+    final_px = np.asarray(final_img)
+    half_h, quarter_h = digit_h//2, digit_h//4
+    sep_color = ImageColor.getrgb(DIGIT_SEP)
 
     # Create the "middle" step of change with the top half of final digit and bottom half of initial
-    step2 = init_img.copy()
-    top2 = final_img.crop((0, 0, digit_w, digit_h//2))
-    step2.paste(top2, (0, 0))
+    step2 = init_px.copy()
+    step2[:half_h] = final_px[:half_h]
 
     # Create first step of change:
     step1 = step2.copy()
     # Shrink top half of initial digit to half-size vertically
-    init_top_tilt = init_img.resize((digit_w, digit_h//4), box=(0, 0, digit_w, digit_h//2))
+    init_top_tilt = init_img.resize((digit_w, quarter_h), box=(0, 0, digit_w, half_h))
     # Display it 1/4 - 1/2 way down our split image
-    step1.paste(init_top_tilt, (0, digit_h//4))
+    step1[quarter_h:quarter_h*2] = np.asarray(init_top_tilt)
     # Small line across top to add "thickness" to flipping card
-    drw = ImageDraw.Draw(step1)
-    drw.line((RECT_RADIUS, digit_h//4, digit_w - RECT_RADIUS, digit_h//4), fill=DIGIT_SEP, width=1)
+    step1[quarter_h, RECT_RADIUS:digit_w - RECT_RADIUS + 1] = sep_color
 
     # Create third step of change:
     step3 = step2.copy()
     # Shrink bottom half of final digit to half-size vertically
-    final_bottom_tilt = final_img.resize((digit_w, digit_h//4), box=(0, digit_h//2, digit_w, digit_h))
+    final_bottom_tilt = final_img.resize((digit_w, quarter_h), box=(0, half_h, digit_w, digit_h))
     # Display it 1/2 - 3/4 way down our split image
-    step3.paste(final_bottom_tilt, (0, digit_h//2))
+    step3[half_h:half_h + quarter_h] = np.asarray(final_bottom_tilt)
     # Small line across top for some depth
-    drw = ImageDraw.Draw(step3)
-    drw.line((RECT_RADIUS, (digit_h*3)//4, digit_w - RECT_RADIUS, (digit_h*3)//4), fill=DIGIT_SEP, width=1)
+    step3[(digit_h*3)//4, RECT_RADIUS:digit_w - RECT_RADIUS + 1] = sep_color
 
     # Save files in format: <initial_digit><final_digit><step>.ext
-    saveImage(init_img, f'{init_dig}{init_dig}0')
-    saveImage(step1, f'{init_dig}{final_dig}1')
-    saveImage(step2, f'{init_dig}{final_dig}2')
-    saveImage(step3, f'{init_dig}{final_dig}3')
-    # saveImage(final_img, f'{final_dig}{final_dig}0')    # "final" image will be saved on next call
+    saveImage(Image.fromarray(step1), f'{init_dig}{final_dig}1')
+    saveImage(Image.fromarray(step2), f'{init_dig}{final_dig}2')
+    saveImage(Image.fromarray(step3), f'{init_dig}{final_dig}3')
 
 
-# main program:
+# computed at import so that worker processes also have them: forked workers
+# inherit the parent's digit images instead of rendering their own
 font_size, digit_w, digit_h = compute_sizes()
+font = ImageFont.truetype(FONT_FACE, font_size)
+# most digits appear in several pairs: render each one only once
+digit_imgs = {digit: make_digit_image(digit, font) for digit in f'0123456789{BLANK_FLAG}'}
 
-print(f'Font size: {font_size}, digit w, h: {digit_w}, {digit_h}')
 
-# Units transitions
-digits = '01234567890'      # wrap around
-for i in range(len(digits)-1):
-    make_images(digits[i:i+2])
-
-# Minutes tens wrap (59 -> 00)
-make_images('50')
-
-# Hours units wrap for 12-hour clock (12 -> 01)
-make_images('21')
-# Hours units wrap for 24-hour clock ('23' -> '00')
-make_images('30')
-
-# Hours tens wrap with leading zero (12 -> 01)
-make_images('10')
-# Hours tens wrap for 24-hour clock ('23' -> '00')
-make_images('20')
-# Hours tens wrap with leading blank (' 9' -> '10' & '12' -> ' 1')
-make_images('x1')
-make_images('1x')
+# main program:
+if __name__ == '__main__':
+    print(f'Font size: {font_size}, digit w, h: {digit_w}, {digit_h}')
+    # fail early with a clear message, before starting the worker processes
+    if not pathlib.Path(OUT_PATH).is_dir():
+        print(f'Output folder not found: {OUT_PATH}')
+        exit(1)
 
-make_colons()
+    # Units transitions
+    digits = '01234567890'      # wrap around
+    pairs = [digits[i:i+2] for i in range(len(digits)-1)]
+    pairs += [
+        '50',       # Minutes tens wrap (59 -> 00)
+        '21',       # Hours units wrap for 12-hour clock (12 -> 01)
+        '30',       # Hours units wrap for 24-hour clock ('23' -> '00')
+        '10',       # Hours tens wrap with leading zero (12 -> 01)
+        '20',       # Hours tens wrap for 24-hour clock ('23' -> '00')
+        'x1',       # Hours tens wrap with leading blank (' 9' -> '10' & '12' -> ' 1')
+        '1x',
+    ]
+
+    # Each pair (and each whole digit) writes its own files, so generate them in parallel
+    with multiprocessing.Pool() as pool:
+        pool.map(make_whole_image, sorted({pair[0] for pair in pairs}))
+        pool.map(make_images, pairs)
+
+    make_colons()